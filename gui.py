@@ -5,6 +5,7 @@
 import sys
 import re
 import threading
+from collections import Counter, deque
 import serial
 import serial.tools.list_ports
 from PyQt5.QtWidgets import (
@@ -21,17 +22,20 @@ from PyQt5.QtWidgets import (
 from PyQt5.QtCore import QTimer, QEvent, QObject, pyqtSignal
 from PyQt5.QtGui import QColor
 
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
+import pyqtgraph as pg
 from typing import Optional
 
 from serial_worker import SerialWorker
 from parsers import ResponseParser, parse_payload
-from utils import strength_to_percentage
+from utils import parse_strength, strength_to_percentage
 from constants import STRENGTH_HISTORY_LEN
 
 # endregion
 
+# Bare hex tag ids sometimes appear outside a CS/OK response; compiled once
+# since process_line tests this on every unrecognized line.
+_HEX_RE = re.compile(r"[0-9A-Fa-f]+")
+
 class c:
     red       = "#ffb3b3"
     green     = "#b3ffcc"
@@ -54,13 +58,15 @@ class c:
     highlight = "#A6A6A6"
     alert     = "#595959"
 
-class MplCanvas(FigureCanvas):
-    """Simple matplotlib canvas for live plots."""
+class StrengthPlot(pg.PlotWidget):
+    """pyqtgraph widget for the live signal strength plot."""
 
     def __init__(self) -> None:
-        fig = Figure(figsize=(5, 3))
-        super().__init__(fig)
-        self.axes = fig.add_subplot(111)
+        super().__init__()
+        self.curve = self.plot(pen="y", symbol="o")
+        self.setYRange(0, 100)
+        self.setLabel("bottom", "Read")
+        self.setLabel("left", "Signal strength (%)")
 
 class LayoutFrameMixer:
     """Adding framing to layouts."""
@@ -158,6 +164,12 @@ class MainWindow(QMainWindow):
         self.timer.timeout.connect(self.update_progress)
         self.timer.start(100)
 
+        # Coalesce reader output to at most one drain per frame (~16 ms)
+        self._drain_timer = QTimer(self)
+        self._drain_timer.setSingleShot(True)
+        self._drain_timer.setInterval(16)
+        self._drain_timer.timeout.connect(self._drain_lines)
+
         self.worker = None
         self.auto_reconnect = False
         self.reconnecting = False
@@ -168,7 +180,9 @@ class MainWindow(QMainWindow):
 
         self.refresh_ports()
 
-        self.silent_queue: list[str] = []
+        self.silent_queue: deque[str] = deque()
+        # Cached head of silent_queue so per-line checks avoid indexing
+        self._silent_head: Optional[str] = None
         self.current_cmd: Optional[str] = None
         self.current_silent = False
         self.response_parser = ResponseParser()
@@ -249,7 +263,7 @@ class MainWindow(QMainWindow):
         b_clear_table = QPushButton("Clear Tags"); b_clear_table.clicked.connect(self.clear_table)
         tableLayout.addWidget(b_clear_table)
 
-        self.tag_counts, self.tag_strengths, self.tag_min_strengths, self.tag_max_strengths = {}, {}, {}, {}
+        self.tag_counts, self.tag_strengths, self.tag_min_strengths, self.tag_max_strengths = Counter(), {}, {}, {}
         self.strength_history_len = STRENGTH_HISTORY_LEN
         self.pending_tag = self.selected_tag = self.search_tag = None; self.search_tag_seen = False
 
@@ -345,7 +359,17 @@ class MainWindow(QMainWindow):
             plotLayout = DVBoxLayout()
             plotLayout.setColor(c.tertiary)
             plotLayout.addWidget(QLabel("Signal Strength"))
-            self.strength_canvas = MplCanvas()
+            self.strength_canvas = StrengthPlot()
+            self._plot_dirty = False
+
+            class _ShowEF(QObject):  # show event filter
+                def __init__(self, cb, parent=None): super().__init__(parent); self.cb=cb
+                def eventFilter(self, obj, ev):
+                    if ev.type()==QEvent.Show: self.cb()
+                    return False
+
+            self._plot_ef = _ShowEF(self.on_plot_shown, self.strength_canvas)
+            self.strength_canvas.installEventFilter(self._plot_ef)
             plotLayout.addWidget(self.strength_canvas)
             return plotLayout
 
@@ -427,7 +451,7 @@ class MainWindow(QMainWindow):
         self.worker = SerialWorker(port)
         self.worker.connected.connect(self.on_port_opened)
         self.worker.disconnected.connect(self.on_disconnected)
-        self.worker.line_received.connect(self.process_line)
+        self.worker.lines_ready.connect(self._schedule_drain)
         self.worker.command_sent.connect(self.on_command_sent)
         self.worker.start()
 
@@ -503,6 +527,7 @@ class MainWindow(QMainWindow):
         if silent:
             for part in cmd.split(";"):
                 self.silent_queue.append(part.strip())
+            self._silent_head = self.silent_queue[0]
 
         self.worker.write(cmd, not silent)
         self.input.clear()
@@ -569,30 +594,47 @@ class MainWindow(QMainWindow):
 
     def on_command_sent(self, cmd: str):
         """Log sent commands that aren't silent."""
-        if self.silent_queue and self.silent_queue[0] == cmd:
+        if cmd == self._silent_head:
             return
         self.log.append(f">> {cmd}")
 
+    def _schedule_drain(self) -> None:
+        """Arm the drain timer when the worker reports queued lines."""
+        if not self._drain_timer.isActive():
+            self._drain_timer.start()
+
+    def _drain_lines(self) -> None:
+        """Drain and process everything the worker has queued."""
+        if self.worker:
+            self.process_lines(self.worker.take_lines())
+
+    def process_lines(self, lines: list) -> None:
+        """Process a batch of reader output lines."""
+        for line in lines:
+            self.process_line(line)
+
     def process_line(self, line: str):
         """Process a single line of reader output."""
         if self.awaiting_vr and not self.received_response:
             self.received_response = True
             self.connect_poll_timer.stop()
-        if line.startswith("EP:") or line.startswith("RI:"):
-            self.handle_inventory_line(line)
+        # Slice the prefix once; _handle_inventory gets the pre-stripped body
+        # so the hottest path (the inventory stream) scans each line once.
+        if len(line) >= 3 and line[2] == ":" and line[:2] in ("EP", "RI"):
+            self._handle_inventory(line[:2], line[3:].strip())
             return
 
         resp = self.response_parser.feed(line)
 
         if self.response_parser.command and self.current_cmd != self.response_parser.command:
             self.current_cmd = self.response_parser.command
-            self.current_silent = bool(self.silent_queue and self.silent_queue[0] == self.current_cmd)
+            self.current_silent = self.current_cmd == self._silent_head
 
         if resp is None:
             if not self.current_silent:
-                if ":" not in line and re.fullmatch(r"[0-9A-Fa-f]+", line.strip()):
+                if ":" not in line and _HEX_RE.fullmatch(line.strip()):
                     tag = line.strip()
-                    self.tag_counts[tag] = self.tag_counts.get(tag, 0) + 1
+                    self.tag_counts[tag] += 1
                     self.update_table()
                 self.log.append(f"<< {line}")
             return
@@ -629,7 +671,8 @@ class MainWindow(QMainWindow):
                 self.log.append(f"<< ER: {resp.error}")
 
         if self.current_silent and self.silent_queue:
-            self.silent_queue.pop(0)
+            self.silent_queue.popleft()
+            self._silent_head = self.silent_queue[0] if self.silent_queue else None
         self.current_silent = False
         self.current_cmd = None
         self.update_table()
@@ -677,8 +720,7 @@ class MainWindow(QMainWindow):
         items = self.table.selectedItems()
         if not items:
             self.selected_tag = None
-            self.strength_canvas.axes.cla()
-            self.strength_canvas.draw()
+            self.strength_canvas.curve.setData([], [])
             return
         row = self.table.currentRow()
         tag_item = self.table.item(row, 0)
@@ -686,59 +728,55 @@ class MainWindow(QMainWindow):
             self.selected_tag = tag_item.text()
             self.update_strength_plot()
 
+    def on_plot_shown(self) -> None:
+        """Perform a deferred redraw if updates were skipped while hidden."""
+        if self._plot_dirty:
+            QTimer.singleShot(0, self.update_strength_plot)
+
     def update_strength_plot(self) -> None:
         """Draw signal strength history for the selected tag."""
         if not self.selected_tag:
             return
-        data = [v for v in self.tag_strengths.get(self.selected_tag, []) if v is not None]
-        ax = self.strength_canvas.axes
-        ax.cla()
-        if data:
-            ax.plot(range(len(data)), data, marker="o")
-            ax.set_ylim(0, 100)
-        ax.set_xlabel("Read")
-        ax.set_ylabel("Signal strength (%)")
-        self.strength_canvas.draw()
-
-    def handle_inventory_line(self, line: str) -> None:
-        """Process inventory EP/RI lines."""
-        if line.startswith("EP:"):
-            tag = line[3:].strip().lstrip('0') 
+        # Skip drawing while the canvas is hidden or has no usable area;
+        # on_plot_shown performs one catch-up redraw when it reappears.
+        if not self.strength_canvas.isVisible() or self.strength_canvas.width() < 2:
+            self._plot_dirty = True
+            return
+        self._plot_dirty = False
+        # Histories hold only real values now, so no None filtering is needed;
+        # list() snapshots the deque for plotting.
+        data = list(self.tag_strengths.get(self.selected_tag, ()))
+        self.strength_canvas.curve.setData(range(len(data)), data)
+
+    def _handle_inventory(self, prefix: str, body: str) -> None:
+        """Process inventory EP/RI lines already split into prefix and body."""
+        if prefix == "EP":
+            tag = body.lstrip('0')
             if not tag:
                 return
+            # Interned to match the decoder: repeat reads of the same tag
+            # reuse one string object across all the per-tag dicts.
+            tag = sys.intern(tag)
             self.pending_tag = tag
             if self.search_tag and tag == self.search_tag:
                 self.search_tag_seen = True
                 self.update_search_tag_color()
-            self.tag_counts[tag] = self.tag_counts.get(tag, 0) + 1
-            hist = self.tag_strengths.setdefault(tag, [])
-            hist.append(None)
-            if len(hist) > self.strength_history_len:
-                hist.pop(0)
+            self.tag_counts[tag] += 1
             self.update_table()
             if self.selected_tag == tag:
                 self.update_strength_plot()
-        elif line.startswith("RI:"):
-            val_str = line[3:].strip()
-            try:
-                strength = int(val_str)
-            except ValueError:
-                try:
-                    strength = float(val_str)
-                except ValueError:
-                    strength = None
+        elif prefix == "RI":
+            strength = parse_strength(body)
             if strength is not None:
                 strength = strength_to_percentage(strength)
             if self.pending_tag:
-                hist = self.tag_strengths.setdefault(self.pending_tag, [])
-                if hist:
-                    if hist[-1] is None:
-                        hist[-1] = strength
-                    else:
-                        hist.append(strength)
-                        if len(hist) > self.strength_history_len:
-                            hist.pop(0)
                 if strength is not None:
+                    hist = self.tag_strengths.get(self.pending_tag)
+                    if hist is None:
+                        hist = self.tag_strengths[self.pending_tag] = deque(
+                            maxlen=self.strength_history_len
+                        )
+                    hist.append(strength)
                     cur_min = self.tag_min_strengths.get(self.pending_tag)
                     if cur_min is None or strength < cur_min:
                         self.tag_min_strengths[self.pending_tag] = strength
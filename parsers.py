@@ -7,17 +7,33 @@ information) and ``.bl`` (battery information) operations, but the design is
 extensible to support additional commands with different payload structures.
 """
 
+import sys
 from typing import Dict, List, Optional
 from abc import ABC, abstractmethod
+from collections import Counter, deque
 from dataclasses import dataclass
 
 from constants import VERSION_LABELS, BATTERY_LABELS, STRENGTH_HISTORY_LEN
-from utils import strength_to_percentage
+from utils import parse_strength, strength_to_percentage
 
 
 DecoderContext = Dict[str, Dict[str, str]]
 
 
+def _identity(v: str) -> str:
+    return v
+
+
+def _pct(v: str) -> str:
+    return v if v.endswith("%") else f"{v}%"
+
+
+# Per-field value formatters, looked up once per line instead of branching
+# on the field name inside the decoder loops.
+VERSION_FORMATTERS = {"BV": lambda v: f"{v}mV"}
+BATTERY_FORMATTERS = {"BP": _pct}
+
+
 class PayloadDecoder(ABC):
     """Interface for command-specific payload decoders."""
 
@@ -37,18 +53,15 @@ class VersionDecoder(PayloadDecoder):
 
     def parse(self, lines: List[str], context: DecoderContext) -> None:
         info = context.setdefault(self.target, {})
+        labels_get = VERSION_LABELS.get
+        formatters_get = VERSION_FORMATTERS.get
         for line in lines:
-            if ":" not in line:
+            key, sep, val = line.partition(":")
+            if not sep:
                 continue
-            key, val = line.split(":", 1)
             field = key.strip()
-            label = VERSION_LABELS.get(field, field)
-            v = val.strip()
-
-            if field == "BV":
-                info[label] = f"{v}mV"
-            else:
-                info[label] = v
+            label = labels_get(field, field)
+            info[label] = formatters_get(field, _identity)(val.strip())
 
 
 class BatteryDecoder(PayloadDecoder):
@@ -59,18 +72,15 @@ class BatteryDecoder(PayloadDecoder):
 
     def parse(self, lines: List[str], context: DecoderContext) -> None:
         info = context.setdefault(self.target, {})
+        labels_get = BATTERY_LABELS.get
+        formatters_get = BATTERY_FORMATTERS.get
         for line in lines:
-            if ":" not in line:
+            key, sep, val = line.partition(":")
+            if not sep:
                 continue
-            key, val = line.split(":", 1)
             field = key.strip()
-            label = BATTERY_LABELS.get(field, field)
-            v = val.strip()
-
-            if field == "BP":
-                info[label] = v if v.endswith("%") else f"{v}%"
-            else:
-                info[label] = v
+            label = labels_get(field, field)
+            info[label] = formatters_get(field, _identity)(val.strip())
 
 
 class InventoryDecoder(PayloadDecoder):
@@ -85,44 +95,38 @@ class InventoryDecoder(PayloadDecoder):
     history_len = STRENGTH_HISTORY_LEN
 
     def parse(self, lines: List[str], context: DecoderContext) -> None:
-        counts = context.setdefault(self.count_target, {})
+        counts = context.setdefault(self.count_target, Counter())
         strengths = context.setdefault(self.strength_target, {})
         mins = context.setdefault(self.min_strength_target, {})
         maxs = context.setdefault(self.max_strength_target, {})
+        # Hoist lookups out of the loop; inventory bursts can run to
+        # thousands of lines per response.
+        history_len = self.history_len
+        strengths_get = strengths.get
+        mins_get = mins.get
+        maxs_get = maxs.get
         last_tag: Optional[str] = None
         for line in lines:
-            if line.startswith("EP:"):
+            prefix = line[:3]
+            if prefix == "EP:":
                 tag = line[3:].strip()
                 if tag:
-                    counts[tag] = counts.get(tag, 0) + 1
-                    hist = strengths.setdefault(tag, [])
-                    hist.append(None)
-                    if len(hist) > self.history_len:
-                        hist.pop(0)
+                    # Tags recur constantly; interning makes the later dict
+                    # operations identity-based.
+                    tag = sys.intern(tag)
+                    counts[tag] += 1
                     last_tag = tag
-            elif line.startswith("RI:"):
-                val_str = line[3:].strip()
-                try:
-                    strength = int(val_str)
-                except ValueError:
-                    try:
-                        strength = float(val_str)
-                    except ValueError:
-                        strength = None
+            elif prefix == "RI:":
+                strength = parse_strength(line[3:].strip())
                 if strength is not None:
                     strength = strength_to_percentage(strength)
-                if last_tag:
-                    hist = strengths.setdefault(last_tag, [])
-                    if hist:
-                        if hist[-1] is None:
-                            hist[-1] = strength
-                        else:
-                            hist.append(strength)
-                            if len(hist) > self.history_len:
-                                hist.pop(0)
-                    if strength is not None:
-                        cur_min = mins.get(last_tag)
-                        cur_max = maxs.get(last_tag)
+                    if last_tag:
+                        hist = strengths_get(last_tag)
+                        if hist is None:
+                            hist = strengths[last_tag] = deque(maxlen=history_len)
+                        hist.append(strength)
+                        cur_min = mins_get(last_tag)
+                        cur_max = maxs_get(last_tag)
                         if cur_min is None or strength < cur_min:
                             mins[last_tag] = strength
                         if cur_max is None or strength > cur_max:
@@ -140,8 +144,12 @@ DECODERS: Dict[str, PayloadDecoder] = {
     )
 }
 
+# Bound parse methods so dispatching a response is one dict lookup and one
+# call, with no decoder attribute traversal in between.
+_PARSE_TABLE = {cmd: d.parse for cmd, d in DECODERS.items()}
+
 
-@dataclass
+@dataclass(slots=True)
 class CommandResponse:
     """Container for a complete command response."""
 
@@ -154,45 +162,77 @@ class CommandResponse:
 class ResponseParser:
     """Stateful parser for device output following the CS/OK/ER pattern."""
 
+    __slots__ = ("_command", "_payload", "_idx")
+
+    # Largest payload length observed per command, shared across instances
+    # and used to pre-size the buffer so appends rarely reallocate.
+    _CAP: Dict[str, int] = {}
+
     def __init__(self) -> None:
         self._command: Optional[str] = None
-        self._payload: List[str] = []
+        self._payload: List[Optional[str]] = []
+        self._idx = 0
 
     @property
     def command(self) -> Optional[str]:
         """Return the command currently being parsed, if any."""
         return self._command
 
+    def _on_cs(self, line: str) -> None:
+        self._command = line.partition(":")[2].strip()
+        # The working buffer persists across responses; grow it to the
+        # command's cap once instead of allocating a fresh list per CS:.
+        grow = self._CAP.get(self._command, 16) - len(self._payload)
+        if grow > 0:
+            self._payload.extend([None] * grow)
+        self._idx = 0
+        return None
+
+    def _finish(self, ok: bool, error: Optional[str] = None) -> CommandResponse:
+        command, n = self._command, self._idx
+        if n > self._CAP.get(command, 0):
+            self._CAP[command] = n
+        # Snapshot only the filled entries; the working buffer is reused.
+        resp = CommandResponse(command, self._payload[:n], ok, error)
+        self._command = None
+        self._idx = 0
+        return resp
+
+    def _on_ok(self, line: str) -> Optional[CommandResponse]:
+        if self._command is None:
+            return None
+        return self._finish(True)
+
+    def _on_er(self, line: str) -> Optional[CommandResponse]:
+        if self._command is None:
+            return None
+        return self._finish(False, line.partition(":")[2].strip())
+
+    # Dispatch on the two-character prefix so each line is scanned once,
+    # however many protocol prefixes get added.
+    _FEED_TABLE = {
+        "CS": _on_cs,
+        "OK": _on_ok,
+        "ER": _on_er,
+    }
+
     def feed(self, line: str) -> Optional[CommandResponse]:
         """Feed a single line of text to the parser.
 
         When a full response is collected this returns a :class:`CommandResponse`
         instance; otherwise ``None`` is returned.
         """
-        if line.startswith("CS:"):
-            self._command = line[3:].strip()
-            self._payload = []
-            return None
-
-        if line.startswith("OK:"):
-            if self._command is None:
-                return None
-            resp = CommandResponse(self._command, self._payload, True)
-            self._command = None
-            self._payload = []
-            return resp
-
-        if line.startswith("ER:"):
-            if self._command is None:
-                return None
-            err = line[3:].strip()
-            resp = CommandResponse(self._command, self._payload, False, err)
-            self._command = None
-            self._payload = []
-            return resp
+        if line[2:3] == ":":
+            handler = self._FEED_TABLE.get(line[:2])
+            if handler is not None:
+                return handler(self, line)
 
         if self._command is not None:
-            self._payload.append(line)
+            if self._idx < len(self._payload):
+                self._payload[self._idx] = line
+            else:
+                self._payload.append(line)
+            self._idx += 1
         return None
 
 
@@ -204,7 +244,6 @@ def parse_payload(command: str, lines: List[str], context: DecoderContext) -> No
     requiring the parser interface to change.
     """
 
-    decoder = DECODERS.get(command)
-    if not decoder:
-        return
-    decoder.parse(lines, context)
+    parse = _PARSE_TABLE.get(command)
+    if parse is not None:
+        parse(lines, context)
@@ -1,16 +1,46 @@
 """Utility functions for signal strength conversion."""
 
+import re
+from typing import Optional
+
+_NUMBER_RE = re.compile(r"[-+]?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?")
+
+# Precomputed slope of the [-90, -25] dBm -> [0, 100] % mapping
+_SCALE = 100.0 / 65.0
+
+# Percentages for every integer dBm value in [-127, 0]; readers report a
+# small vocabulary of integer RSSI values, so a table index replaces the
+# clamp-and-scale arithmetic entirely.
+_TABLE = tuple(
+    0 if s <= -90 else 100 if s >= -25 else int((s + 90) * _SCALE + 0.5)
+    for s in range(-127, 1)
+)
+
+
+def parse_strength(text: str) -> Optional[float]:
+    """Parse an RSSI reading as ``int`` or ``float`` without raising.
+
+    Readers report fractional RSSI on some firmware, so routing through a
+    digit check and a regex instead of try/except keeps exception setup
+    off the per-read path. Returns ``None`` for non-numeric input.
+    """
+    s = text[1:] if text[:1] in "+-" else text
+    if s.isdigit():
+        return int(text)
+    if _NUMBER_RE.fullmatch(text):
+        return float(text)
+    return None
+
 
 def strength_to_percentage(strength: float) -> int:
     """Convert RSSI strength in dBm to a percentage.
 
     Strength values at or below -90 map to 0 and values at or above -25 map to
-    100. Values between are scaled linearly.
+    100. Values between are scaled linearly, quantized to whole dBm via the
+    precomputed table.
     """
-    if strength <= -90:
-        return 0
-    if strength >= -25:
-        return 100
-    # Linear interpolation over the range [-90, -25]
-    return int(round((strength + 90) * 100 / 65))
+    i = round(strength)
+    if -127 <= i <= 0:
+        return _TABLE[i + 127]
+    return 100 if i > 0 else 0
 